@@ -10,318 +10,315 @@ import sys
 sys.path.append('/home/ryan/epistemic-distrust')
 
 from epistemic_distrust_v2 import ImprovedDistrustScore, EvidenceSource
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import List
+import numpy as np
 import re
 
+_HEAVY = "=" * 80
+_THIN = "-" * 80
 
-def analyze_storage_system():
-    """
-    Analyze storage system claims using Epistemic Distrust Score
 
-    Claims to verify:
-    1. "10-40× faster reads than PostgreSQL"
-    2. "18× compression ratio"
-    3. "264 lines replaces database"
-    4. "Zero data loss, 4+ days uptime"
-    5. "5.3M records, 502 MB"
-    """
-
-    eds = ImprovedDistrustScore()
-
-    print("=" * 80)
-    print("EPISTEMIC ANALYSIS: Redis→Parquet Storage System Claims")
-    print("=" * 80)
-    print()
-
-    # ========================================================================
-    # Claim 1: "10-40× faster reads than PostgreSQL"
-    # ========================================================================
+def _emit(lines):
+    """Write a block of lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    claim_1_sources = [
-        # Source 1: My own documentation (high authority - I created it)
-        EvidenceSource(
-            "STORAGE_ARCHITECTURE.md claims 10-40× faster based on 5-8ms Parquet vs 50-200ms PostgreSQL",
-            authority_weight=0.75,  # High - official documentation
-            timestamp=datetime(2025, 11, 28, 18, 0),
-            source_id="storage_arch_doc"
-        ),
-
-        # Source 2: Measured benchmark (low authority but actual data)
-        EvidenceSource(
-            "Actual Parquet read: 5.89ms median for 115K records (measured Nov 28)",
-            authority_weight=0.2,  # Low authority (raw measurement)
-            timestamp=datetime(2025, 11, 28, 21, 0),
-            source_id="parquet_benchmark"
-        ),
-
-        # Source 3: PostgreSQL literature comparison (external source)
-        EvidenceSource(
-            "PostgreSQL time-series queries: 50-200ms (from TimescaleDB docs + pgbench results)",
-            authority_weight=0.6,  # Medium authority (established docs)
-            timestamp=datetime(2024, 6, 1),  # Older data
-            source_id="postgresql_literature"
-        ),
-
-        # Source 4: User's own experience (low authority but direct)
-        EvidenceSource(
-            "Previous PostgreSQL system: 50-200ms queries on 101,880 records (Sept 2025 migration notes)",
-            authority_weight=0.3,  # Low-medium (personal observation)
-            timestamp=datetime(2025, 9, 10),
-            source_id="user_migration_notes"
-        ),
-    ]
 
-    result_1 = eds.compute_eds(claim_1_sources)
+@dataclass
+class ClaimSpec:
+    """One claim under review: its evidence and how to report it"""
+    title: str                 # Quoted claim as printed in the section header
+    label: str                 # Short name for the overall assessment table
+    sources: List[EvidenceSource]
+    verification: List[str]    # Pre-formatted "📐 Verification" lines
+    show_temporal: bool = False
 
-    print("📊 CLAIM 1: '10-40× faster reads than PostgreSQL'")
-    print("-" * 80)
-    print(f"Distrust Score: {result_1['distrust_score']:.4f} ({result_1['verdict']})")
-    print(f"Components:")
-    print(f"  - Authority:     {result_1['components']['authority']:.4f}")
-    print(f"  - Entropy:       {result_1['components']['entropy']:.4f}")
-    print(f"  - Coordination:  {result_1['components']['coordination']:.4f}")
-    print(f"  - Temporal:      {result_1['components']['temporal_avg_weight']:.4f}")
-    print()
 
-    # Calculation verification
+def _speedup_verification() -> List[str]:
+    """Claim 1 calculation verification"""
     parquet_ms = 5.89
     postgres_min_ms = 50
     postgres_max_ms = 200
     speedup_min = postgres_min_ms / parquet_ms
     speedup_max = postgres_max_ms / parquet_ms
 
-    print(f"📐 Verification:")
-    print(f"  - Parquet:     {parquet_ms}ms (measured)")
-    print(f"  - PostgreSQL:  {postgres_min_ms}-{postgres_max_ms}ms (literature)")
-    print(f"  - Speedup:     {speedup_min:.1f}-{speedup_max:.1f}× ({'MATCHES CLAIM' if speedup_min >= 8 and speedup_max <= 40 else 'DISCREPANCY'})")
-    print()
-
-    # ========================================================================
-    # Claim 2: "18× compression ratio"
-    # ========================================================================
-
-    claim_2_sources = [
-        # Source 1: My forensic analysis (medium-high authority)
-        EvidenceSource(
-            "SIMPLICITY_ANALYSIS.md: 18.4× compression measured from actual 2025-11-27.parquet file",
-            authority_weight=0.7,
-            timestamp=datetime(2025, 11, 28, 18, 30),
-            source_id="simplicity_analysis"
-        ),
-
-        # Source 2: Actual file measurement (low authority, high provenance)
-        EvidenceSource(
-            "Measured: 2.54 MB Parquet vs 46.7 MB JSON (115,008 records) = 18.4× compression",
-            authority_weight=0.15,  # Raw measurement
-            timestamp=datetime(2025, 11, 28, 21, 15),
-            source_id="file_measurement"
-        ),
-
-        # Source 3: Independent calculation (low authority)
-        EvidenceSource(
-            "Python benchmark script: 18.4× compression ratio verified independently",
-            authority_weight=0.2,
-            timestamp=datetime(2025, 11, 28, 21, 20),
-            source_id="benchmark_script"
-        ),
-
-        # Source 4: Parquet documentation (external, high authority)
-        EvidenceSource(
-            "Apache Parquet docs claim 10-20× compression typical for time-series data",
-            authority_weight=0.65,
-            timestamp=datetime(2023, 8, 1),  # Older
-            source_id="parquet_docs"
-        ),
+    return [
+        f"  - Parquet:     {parquet_ms}ms (measured)",
+        f"  - PostgreSQL:  {postgres_min_ms}-{postgres_max_ms}ms (literature)",
+        f"  - Speedup:     {speedup_min:.1f}-{speedup_max:.1f}× ({'MATCHES CLAIM' if speedup_min >= 8 and speedup_max <= 40 else 'DISCREPANCY'})",
     ]
 
-    result_2 = eds.compute_eds(claim_2_sources)
 
-    print("📊 CLAIM 2: '18× compression ratio'")
-    print("-" * 80)
-    print(f"Distrust Score: {result_2['distrust_score']:.4f} ({result_2['verdict']})")
-    print(f"Components:")
-    print(f"  - Authority:     {result_2['components']['authority']:.4f}")
-    print(f"  - Entropy:       {result_2['components']['entropy']:.4f}")
-    print(f"  - Coordination:  {result_2['components']['coordination']:.4f}")
-    print(f"  - Temporal:      {result_2['components']['temporal_avg_weight']:.4f}")
-    print()
+CLAIMS = [
+    # ========================================================================
+    # Claim 1: "10-40× faster reads than PostgreSQL"
+    # ========================================================================
+    ClaimSpec(
+        title="'10-40× faster reads than PostgreSQL'",
+        label="10-40× faster reads",
+        sources=[
+            # Source 1: My own documentation (high authority - I created it)
+            EvidenceSource(
+                "STORAGE_ARCHITECTURE.md claims 10-40× faster based on 5-8ms Parquet vs 50-200ms PostgreSQL",
+                authority_weight=0.75,  # High - official documentation
+                timestamp=datetime(2025, 11, 28, 18, 0),
+                source_id="storage_arch_doc"
+            ),
+
+            # Source 2: Measured benchmark (low authority but actual data)
+            EvidenceSource(
+                "Actual Parquet read: 5.89ms median for 115K records (measured Nov 28)",
+                authority_weight=0.2,  # Low authority (raw measurement)
+                timestamp=datetime(2025, 11, 28, 21, 0),
+                source_id="parquet_benchmark"
+            ),
+
+            # Source 3: PostgreSQL literature comparison (external source)
+            EvidenceSource(
+                "PostgreSQL time-series queries: 50-200ms (from TimescaleDB docs + pgbench results)",
+                authority_weight=0.6,  # Medium authority (established docs)
+                timestamp=datetime(2024, 6, 1),  # Older data
+                source_id="postgresql_literature"
+            ),
+
+            # Source 4: User's own experience (low authority but direct)
+            EvidenceSource(
+                "Previous PostgreSQL system: 50-200ms queries on 101,880 records (Sept 2025 migration notes)",
+                authority_weight=0.3,  # Low-medium (personal observation)
+                timestamp=datetime(2025, 9, 10),
+                source_id="user_migration_notes"
+            ),
+        ],
+        verification=_speedup_verification(),
+        show_temporal=True,
+    ),
 
-    print(f"📐 Verification:")
-    print(f"  - Parquet size:  2.54 MB (measured)")
-    print(f"  - JSON size:     46.7 MB (calculated)")
-    print(f"  - Ratio:         18.4× (within 10-20× typical range ✓)")
-    print()
+    # ========================================================================
+    # Claim 2: "18× compression ratio"
+    # ========================================================================
+    ClaimSpec(
+        title="'18× compression ratio'",
+        label="18× compression",
+        sources=[
+            # Source 1: My forensic analysis (medium-high authority)
+            EvidenceSource(
+                "SIMPLICITY_ANALYSIS.md: 18.4× compression measured from actual 2025-11-27.parquet file",
+                authority_weight=0.7,
+                timestamp=datetime(2025, 11, 28, 18, 30),
+                source_id="simplicity_analysis"
+            ),
+
+            # Source 2: Actual file measurement (low authority, high provenance)
+            EvidenceSource(
+                "Measured: 2.54 MB Parquet vs 46.7 MB JSON (115,008 records) = 18.4× compression",
+                authority_weight=0.15,  # Raw measurement
+                timestamp=datetime(2025, 11, 28, 21, 15),
+                source_id="file_measurement"
+            ),
+
+            # Source 3: Independent calculation (low authority)
+            EvidenceSource(
+                "Python benchmark script: 18.4× compression ratio verified independently",
+                authority_weight=0.2,
+                timestamp=datetime(2025, 11, 28, 21, 20),
+                source_id="benchmark_script"
+            ),
+
+            # Source 4: Parquet documentation (external, high authority)
+            EvidenceSource(
+                "Apache Parquet docs claim 10-20× compression typical for time-series data",
+                authority_weight=0.65,
+                timestamp=datetime(2023, 8, 1),  # Older
+                source_id="parquet_docs"
+            ),
+        ],
+        verification=[
+            "  - Parquet size:  2.54 MB (measured)",
+            "  - JSON size:     46.7 MB (calculated)",
+            "  - Ratio:         18.4× (within 10-20× typical range ✓)",
+        ],
+        show_temporal=True,
+    ),
 
     # ========================================================================
     # Claim 3: "264 lines replaces database"
     # ========================================================================
-
-    claim_3_sources = [
-        # Source 1: README.md claim (high authority - marketing)
-        EvidenceSource(
-            "README.md: '264 lines of Python replaces 10K+ LOC database'",
-            authority_weight=0.85,  # High authority (official claim)
-            timestamp=datetime(2025, 11, 28, 17, 0),
-            source_id="readme_claim"
-        ),
-
-        # Source 2: My forensic audit (medium authority)
-        EvidenceSource(
-            "Forensic analysis: 264 core archiver + 125 health check + 28 systemd + ~5000 collectors = ~5400 LOC total",
-            authority_weight=0.6,
-            timestamp=datetime(2025, 11, 28, 18, 45),
-            source_id="forensic_audit"
-        ),
-
-        # Source 3: wc -l measurement (low authority, verifiable)
-        EvidenceSource(
-            "Measured: hourly_archiver.py = 264 lines (excludes supporting infrastructure)",
-            authority_weight=0.25,
-            timestamp=datetime(2025, 11, 28, 21, 30),
-            source_id="wc_measurement"
-        ),
-    ]
-
-    result_3 = eds.compute_eds(claim_3_sources)
-
-    print("📊 CLAIM 3: '264 lines replaces database'")
-    print("-" * 80)
-    print(f"Distrust Score: {result_3['distrust_score']:.4f} ({result_3['verdict']})")
-    print(f"Components:")
-    print(f"  - Authority:     {result_3['components']['authority']:.4f}")
-    print(f"  - Entropy:       {result_3['components']['entropy']:.4f}")
-    print(f"  - Coordination:  {result_3['components']['coordination']:.4f}")
-    print()
-
-    print(f"📐 Verification:")
-    print(f"  - Core archiver:          264 lines ✓")
-    print(f"  - Health check:           125 lines")
-    print(f"  - Systemd configs:        28 lines")
-    print(f"  - Collectors:             ~5,000 lines")
-    print(f"  - Total system:           ~5,400 lines")
-    print(f"  - Claim status:           MISLEADING (technically true for archiver only)")
-    print()
+    ClaimSpec(
+        title="'264 lines replaces database'",
+        label="264 lines code",
+        sources=[
+            # Source 1: README.md claim (high authority - marketing)
+            EvidenceSource(
+                "README.md: '264 lines of Python replaces 10K+ LOC database'",
+                authority_weight=0.85,  # High authority (official claim)
+                timestamp=datetime(2025, 11, 28, 17, 0),
+                source_id="readme_claim"
+            ),
+
+            # Source 2: My forensic audit (medium authority)
+            EvidenceSource(
+                "Forensic analysis: 264 core archiver + 125 health check + 28 systemd + ~5000 collectors = ~5400 LOC total",
+                authority_weight=0.6,
+                timestamp=datetime(2025, 11, 28, 18, 45),
+                source_id="forensic_audit"
+            ),
+
+            # Source 3: wc -l measurement (low authority, verifiable)
+            EvidenceSource(
+                "Measured: hourly_archiver.py = 264 lines (excludes supporting infrastructure)",
+                authority_weight=0.25,
+                timestamp=datetime(2025, 11, 28, 21, 30),
+                source_id="wc_measurement"
+            ),
+        ],
+        verification=[
+            "  - Core archiver:          264 lines ✓",
+            "  - Health check:           125 lines",
+            "  - Systemd configs:        28 lines",
+            "  - Collectors:             ~5,000 lines",
+            "  - Total system:           ~5,400 lines",
+            "  - Claim status:           MISLEADING (technically true for archiver only)",
+        ],
+    ),
 
     # ========================================================================
     # Claim 4: "Zero data loss, 4+ days uptime"
     # ========================================================================
-
-    claim_4_sources = [
-        # Source 1: Process uptime (verifiable, low authority)
-        EvidenceSource(
-            "ps command shows PID 22865: 4 days 22 hours 27 minutes uptime (verified Nov 28)",
-            authority_weight=0.2,
-            timestamp=datetime(2025, 11, 28, 21, 40),
-            source_id="ps_uptime"
-        ),
-
-        # Source 2: Health check logs (medium authority)
-        EvidenceSource(
-            "daily_health_check.sh: ALL PASSED - no errors, no data gaps detected",
-            authority_weight=0.5,
-            timestamp=datetime(2025, 11, 28, 6, 0),
-            source_id="health_check"
-        ),
-
-        # Source 3: Parquet file continuity (low authority but verifiable)
-        EvidenceSource(
-            "Parquet archives: continuous timestamps from 2025-11-22 to 2025-11-28, no gaps in candles",
-            authority_weight=0.3,
-            timestamp=datetime(2025, 11, 28, 21, 45),
-            source_id="archive_continuity"
-        ),
-    ]
-
-    result_4 = eds.compute_eds(claim_4_sources)
-
-    print("📊 CLAIM 4: 'Zero data loss, 4+ days uptime'")
-    print("-" * 80)
-    print(f"Distrust Score: {result_4['distrust_score']:.4f} ({result_4['verdict']})")
-    print(f"Components:")
-    print(f"  - Authority:     {result_4['components']['authority']:.4f}")
-    print(f"  - Entropy:       {result_4['components']['entropy']:.4f}")
-    print(f"  - Coordination:  {result_4['components']['coordination']:.4f}")
-    print()
-
-    print(f"📐 Verification:")
-    print(f"  - Uptime:         4d 22h 27m ✓")
-    print(f"  - Data loss:      No gaps detected in archives ✓")
-    print(f"  - Claim status:   VERIFIED")
-    print()
+    ClaimSpec(
+        title="'Zero data loss, 4+ days uptime'",
+        label="Zero data loss",
+        sources=[
+            # Source 1: Process uptime (verifiable, low authority)
+            EvidenceSource(
+                "ps command shows PID 22865: 4 days 22 hours 27 minutes uptime (verified Nov 28)",
+                authority_weight=0.2,
+                timestamp=datetime(2025, 11, 28, 21, 40),
+                source_id="ps_uptime"
+            ),
+
+            # Source 2: Health check logs (medium authority)
+            EvidenceSource(
+                "daily_health_check.sh: ALL PASSED - no errors, no data gaps detected",
+                authority_weight=0.5,
+                timestamp=datetime(2025, 11, 28, 6, 0),
+                source_id="health_check"
+            ),
+
+            # Source 3: Parquet file continuity (low authority but verifiable)
+            EvidenceSource(
+                "Parquet archives: continuous timestamps from 2025-11-22 to 2025-11-28, no gaps in candles",
+                authority_weight=0.3,
+                timestamp=datetime(2025, 11, 28, 21, 45),
+                source_id="archive_continuity"
+            ),
+        ],
+        verification=[
+            "  - Uptime:         4d 22h 27m ✓",
+            "  - Data loss:      No gaps detected in archives ✓",
+            "  - Claim status:   VERIFIED",
+        ],
+    ),
 
     # ========================================================================
     # Claim 5: "5.3M records, 502 MB"
     # ========================================================================
-
-    claim_5_sources = [
-        # Source 1: du command measurement (low authority, verifiable)
-        EvidenceSource(
-            "du -sh /home/ryan/Local_AI/data/archives/ = 502 MB (measured Nov 28)",
-            authority_weight=0.2,
-            timestamp=datetime(2025, 11, 28, 21, 50),
-            source_id="du_measurement"
-        ),
-
-        # Source 2: find command file count (low authority, verifiable)
-        EvidenceSource(
-            "find command: 5,286 .parquet files in archives (Nov 28)",
-            authority_weight=0.2,
-            timestamp=datetime(2025, 11, 28, 21, 52),
-            source_id="find_count"
-        ),
-
-        # Source 3: Pandas record count (low authority, direct)
-        EvidenceSource(
-            "Pandas: 625,294 BTC candles in 2025-11-27.parquet alone, extrapolated to ~5.3M total",
-            authority_weight=0.3,
-            timestamp=datetime(2025, 11, 28, 21, 55),
-            source_id="pandas_count"
-        ),
+    ClaimSpec(
+        title="'5.3M records, 502 MB'",
+        label="5.3M records",
+        sources=[
+            # Source 1: du command measurement (low authority, verifiable)
+            EvidenceSource(
+                "du -sh /home/ryan/Local_AI/data/archives/ = 502 MB (measured Nov 28)",
+                authority_weight=0.2,
+                timestamp=datetime(2025, 11, 28, 21, 50),
+                source_id="du_measurement"
+            ),
+
+            # Source 2: find command file count (low authority, verifiable)
+            EvidenceSource(
+                "find command: 5,286 .parquet files in archives (Nov 28)",
+                authority_weight=0.2,
+                timestamp=datetime(2025, 11, 28, 21, 52),
+                source_id="find_count"
+            ),
+
+            # Source 3: Pandas record count (low authority, direct)
+            EvidenceSource(
+                "Pandas: 625,294 BTC candles in 2025-11-27.parquet alone, extrapolated to ~5.3M total",
+                authority_weight=0.3,
+                timestamp=datetime(2025, 11, 28, 21, 55),
+                source_id="pandas_count"
+            ),
+        ],
+        verification=[
+            "  - Disk usage:     502 MB ✓ (measured)",
+            "  - File count:     5,286 files ✓ (measured)",
+            "  - Record count:   ~5.3M (extrapolated from samples)",
+            "  - Claim status:   VERIFIED",
+        ],
+    ),
+]
+
+
+def _claim_report(index: int, claim: ClaimSpec, result: dict) -> List[str]:
+    """Scores, components and verification lines for one claim"""
+    c = result['components']
+    lines = [
+        f"📊 CLAIM {index}: {claim.title}",
+        _THIN,
+        f"Distrust Score: {result['distrust_score']:.4f} ({result['verdict']})",
+        "Components:",
+        f"  - Authority:     {c['authority']:.4f}",
+        f"  - Entropy:       {c['entropy']:.4f}",
+        f"  - Coordination:  {c['coordination']:.4f}",
     ]
+    if claim.show_temporal:
+        lines.append(f"  - Temporal:      {c['temporal_avg_weight']:.4f}")
+    lines += ["", "📐 Verification:", *claim.verification, ""]
+    return lines
 
-    result_5 = eds.compute_eds(claim_5_sources)
 
-    print("📊 CLAIM 5: '5.3M records, 502 MB'")
-    print("-" * 80)
-    print(f"Distrust Score: {result_5['distrust_score']:.4f} ({result_5['verdict']})")
-    print(f"Components:")
-    print(f"  - Authority:     {result_5['components']['authority']:.4f}")
-    print(f"  - Entropy:       {result_5['components']['entropy']:.4f}")
-    print(f"  - Coordination:  {result_5['components']['coordination']:.4f}")
-    print()
+def analyze_storage_system():
+    """
+    Analyze storage system claims using Epistemic Distrust Score
 
-    print(f"📐 Verification:")
-    print(f"  - Disk usage:     502 MB ✓ (measured)")
-    print(f"  - File count:     5,286 files ✓ (measured)")
-    print(f"  - Record count:   ~5.3M (extrapolated from samples)")
-    print(f"  - Claim status:   VERIFIED")
-    print()
+    Claims to verify:
+    1. "10-40× faster reads than PostgreSQL"
+    2. "18× compression ratio"
+    3. "264 lines replaces database"
+    4. "Zero data loss, 4+ days uptime"
+    5. "5.3M records, 502 MB"
+    """
+
+    eds = ImprovedDistrustScore()
+
+    # Score every claim in one batched call
+    results = eds.compute_eds_batch([claim.sources for claim in CLAIMS])
+    result_1, result_2, result_3, result_4, result_5 = results
+
+    lines = [
+        _HEAVY,
+        "EPISTEMIC ANALYSIS: Redis→Parquet Storage System Claims",
+        _HEAVY,
+        "",
+    ]
+    for index, (claim, result) in enumerate(zip(CLAIMS, results), start=1):
+        lines += _claim_report(index, claim, result)
+    _emit(lines)
 
     # ========================================================================
     # OVERALL ASSESSMENT
     # ========================================================================
 
-    print("=" * 80)
-    print("OVERALL EPISTEMIC ASSESSMENT")
-    print("=" * 80)
-    print()
-
-    all_claims = [
-        ("10-40× faster reads", result_1['distrust_score'], result_1['verdict']),
-        ("18× compression", result_2['distrust_score'], result_2['verdict']),
-        ("264 lines code", result_3['distrust_score'], result_3['verdict']),
-        ("Zero data loss", result_4['distrust_score'], result_4['verdict']),
-        ("5.3M records", result_5['distrust_score'], result_5['verdict']),
-    ]
-
-    avg_distrust = sum(score for _, score, _ in all_claims) / len(all_claims)
+    scores = np.array([result['distrust_score'] for result in results])
+    avg_distrust = np.mean(scores)
 
-    for claim, score, verdict in all_claims:
+    lines = [_HEAVY, "OVERALL EPISTEMIC ASSESSMENT", _HEAVY, ""]
+    for claim, result in zip(CLAIMS, results):
+        score = result['distrust_score']
         status = "✓" if score < 0.4 else "⚠️" if score < 0.7 else "❌"
-        print(f"{status} {claim:25} {score:.4f} ({verdict})")
-
-    print()
-    print(f"Average Distrust Score: {avg_distrust:.4f}")
+        lines.append(f"{status} {claim.label:25} {score:.4f} ({result['verdict']})")
 
     if avg_distrust < 0.3:
         overall = "HIGH CONFIDENCE - Claims well-supported by diverse evidence"
@@ -330,81 +327,89 @@ def analyze_storage_system():
     else:
         overall = "LOW CONFIDENCE - Significant skepticism warranted"
 
-    print(f"Overall Assessment: {overall}")
-    print()
+    lines += [
+        "",
+        f"Average Distrust Score: {avg_distrust:.4f}",
+        f"Overall Assessment: {overall}",
+        "",
+    ]
+    _emit(lines)
 
     # ========================================================================
     # KEY FINDINGS
     # ========================================================================
 
-    print("=" * 80)
-    print("KEY FINDINGS")
-    print("=" * 80)
-    print()
-
-    print("1. PERFORMANCE CLAIMS (10-40× faster):")
-    print(f"   - Distrust: {result_1['distrust_score']:.4f} ({result_1['verdict']})")
-    print("   - Evidence: Multiple independent sources (benchmark + literature + user)")
-    print("   - Verdict: ✓ CREDIBLE (8.5-34× measured, within claimed range)")
-    print()
-
-    print("2. COMPRESSION CLAIMS (18×):")
-    print(f"   - Distrust: {result_2['distrust_score']:.4f} ({result_2['verdict']})")
-    print("   - Evidence: Direct measurement + literature validation")
-    print("   - Verdict: ✓ CREDIBLE (18.4× measured, within 10-20× typical)")
-    print()
-
-    print("3. COMPLEXITY CLAIMS (264 lines):")
-    print(f"   - Distrust: {result_3['distrust_score']:.4f} ({result_3['verdict']})")
+    lines = [
+        _HEAVY,
+        "KEY FINDINGS",
+        _HEAVY,
+        "",
+        "1. PERFORMANCE CLAIMS (10-40× faster):",
+        f"   - Distrust: {result_1['distrust_score']:.4f} ({result_1['verdict']})",
+        "   - Evidence: Multiple independent sources (benchmark + literature + user)",
+        "   - Verdict: ✓ CREDIBLE (8.5-34× measured, within claimed range)",
+        "",
+        "2. COMPRESSION CLAIMS (18×):",
+        f"   - Distrust: {result_2['distrust_score']:.4f} ({result_2['verdict']})",
+        "   - Evidence: Direct measurement + literature validation",
+        "   - Verdict: ✓ CREDIBLE (18.4× measured, within 10-20× typical)",
+        "",
+        "3. COMPLEXITY CLAIMS (264 lines):",
+        f"   - Distrust: {result_3['distrust_score']:.4f} ({result_3['verdict']})",
+    ]
     if result_3['distrust_score'] > 0.4:
-        print("   - Evidence: Single high-authority source (marketing)")
-        print("   - Forensic audit reveals: 264 archiver + ~5,400 total system")
-        print("   - Verdict: ⚠️ MISLEADING (technically true but incomplete)")
+        lines += [
+            "   - Evidence: Single high-authority source (marketing)",
+            "   - Forensic audit reveals: 264 archiver + ~5,400 total system",
+            "   - Verdict: ⚠️ MISLEADING (technically true but incomplete)",
+        ]
     else:
-        print("   - Evidence: Verified by line count")
-        print("   - Verdict: ✓ ACCURATE (for archiver component)")
-    print()
-
-    print("4. RELIABILITY CLAIMS (4+ days uptime):")
-    print(f"   - Distrust: {result_4['distrust_score']:.4f} ({result_4['verdict']})")
-    print("   - Evidence: Process uptime + health checks + archive continuity")
-    print("   - Verdict: ✓ VERIFIED (4d 22h measured)")
-    print()
-
-    print("5. SCALE CLAIMS (5.3M records):")
-    print(f"   - Distrust: {result_5['distrust_score']:.4f} ({result_5['verdict']})")
-    print("   - Evidence: Direct measurements (file count + size)")
-    print("   - Verdict: ✓ VERIFIED")
-    print()
+        lines += [
+            "   - Evidence: Verified by line count",
+            "   - Verdict: ✓ ACCURATE (for archiver component)",
+        ]
+    lines += [
+        "",
+        "4. RELIABILITY CLAIMS (4+ days uptime):",
+        f"   - Distrust: {result_4['distrust_score']:.4f} ({result_4['verdict']})",
+        "   - Evidence: Process uptime + health checks + archive continuity",
+        "   - Verdict: ✓ VERIFIED (4d 22h measured)",
+        "",
+        "5. SCALE CLAIMS (5.3M records):",
+        f"   - Distrust: {result_5['distrust_score']:.4f} ({result_5['verdict']})",
+        "   - Evidence: Direct measurements (file count + size)",
+        "   - Verdict: ✓ VERIFIED",
+        "",
+    ]
+    _emit(lines)
 
     # ========================================================================
     # RECOMMENDATIONS
     # ========================================================================
 
-    print("=" * 80)
-    print("RECOMMENDATIONS")
-    print("=" * 80)
-    print()
-
-    print("✅ KEEP (high confidence claims):")
-    print("   - '10-40× faster reads' (backed by multiple sources)")
-    print("   - '18× compression' (measured + validated)")
-    print("   - '4+ days uptime, zero data loss' (verified)")
-    print("   - '5.3M records, 502 MB' (measured)")
-    print()
-
-    print("⚠️  REVISE (potentially misleading):")
-    print("   - '264 lines replaces database'")
-    print("     → Better: '264 lines core archiver + ~400 lines total system'")
-    print("     → Or: 'Simple Python archiver (264 LOC core, ~5400 LOC total with collectors)'")
-    print()
-
-    print("🔍 ADD (increase provenance):")
-    print("   - Link to actual benchmark scripts")
-    print("   - Include reproducibility instructions")
-    print("   - Add timestamps to all measurements")
-    print("   - Reference external sources (TimescaleDB docs, Parquet benchmarks)")
-    print()
+    _emit([
+        _HEAVY,
+        "RECOMMENDATIONS",
+        _HEAVY,
+        "",
+        "✅ KEEP (high confidence claims):",
+        "   - '10-40× faster reads' (backed by multiple sources)",
+        "   - '18× compression' (measured + validated)",
+        "   - '4+ days uptime, zero data loss' (verified)",
+        "   - '5.3M records, 502 MB' (measured)",
+        "",
+        "⚠️  REVISE (potentially misleading):",
+        "   - '264 lines replaces database'",
+        "     → Better: '264 lines core archiver + ~400 lines total system'",
+        "     → Or: 'Simple Python archiver (264 LOC core, ~5400 LOC total with collectors)'",
+        "",
+        "🔍 ADD (increase provenance):",
+        "   - Link to actual benchmark scripts",
+        "   - Include reproducibility instructions",
+        "   - Add timestamps to all measurements",
+        "   - Reference external sources (TimescaleDB docs, Parquet benchmarks)",
+        "",
+    ])
 
 
 if __name__ == "__main__":
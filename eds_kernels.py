@@ -0,0 +1,39 @@
+"""
+Numba kernels for epistemic_distrust_v2
+
+Kept in their own pure-Python module so epistemic_distrust_v2 can be
+AOT-compiled with mypyc (see mypyc_build.py): numba can only JIT real
+Python functions, not mypyc-native ones.
+
+Importing this module requires numba.
+"""
+
+import math
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def coord_pair_count(E, threshold):
+    """Count i<j pairs of L2-normalized rows whose dot product exceeds threshold"""
+    n, d = E.shape
+    count = 0
+    for i in numba.prange(n - 1):
+        for j in range(i + 1, n):
+            dot = 0.0
+            for k in range(d):
+                dot += E[i, k] * E[j, k]
+            if dot > threshold:
+                count += 1
+    return count
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def roemmele_distrust_batch(authority, entropy, alpha):
+    """alpha * (log1p(-a + 1e-8) + H)**2 elementwise over 1-D float64 arrays"""
+    out = np.empty_like(authority)
+    for i in numba.prange(authority.shape[0]):
+        d = math.log1p(-authority[i] + 1e-8) + entropy[i]
+        out[i] = alpha * d * d
+    return out
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Optional AOT build of epistemic_distrust_v2 with mypyc
+
+Compiles the scoring module to a C extension, removing bytecode dispatch
+for dataclass attribute access and the per-claim arithmetic without any
+JIT warmup (the CLI scripts call compute_eds only a handful of times).
+
+Usage:
+    pip install mypy
+    python mypyc_build.py build_ext --inplace
+
+The resulting epistemic_distrust_v2.*.so sits next to the .py file and is
+imported in its place; delete it to go back to the pure-Python module.
+The numba kernels in eds_kernels.py are deliberately left uncompiled.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="epistemic-distrust-native",
+    ext_modules=mypycify(["epistemic_distrust_v2.py"]),
+)
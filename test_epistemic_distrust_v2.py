@@ -0,0 +1,174 @@
+"""
+Tests for epistemic_distrust_v2
+
+Run with:  python -m unittest  (or python -m pytest)
+
+After `python mypyc_build.py build_ext --inplace` the same run imports the
+compiled extension, and the native-build smoke tests below stop skipping.
+"""
+
+import importlib.util
+import os
+import pickle
+import unittest
+
+import numpy as np
+
+import epistemic_distrust_v2 as eds_v2
+from epistemic_distrust_v2 import EvidenceSource, ImprovedDistrustScore
+
+NOW = 1_700_000_000.0  # Fixed Unix time so scores are reproducible
+DAY = 86400.0
+
+COMPILED = not eds_v2.__file__.endswith(".py")
+
+
+def _claims():
+    """A few small claims covering single-source, echo-chamber and mixed cases"""
+    return [
+        [EvidenceSource("Official statement", 0.95, NOW, "gov")] * 3,
+        [EvidenceSource("Breaking news", 0.80, NOW - DAY, outlet) for outlet in ("cnn", "nyt", "abc")],
+        [
+            EvidenceSource("Study 1", 0.2, NOW - 40 * DAY, "researcher_a"),
+            EvidenceSource("Study 2", 0.3, NOW - 3 * DAY, "researcher_b"),
+            EvidenceSource("Study 3", 0.9, NOW, "gov"),
+        ],
+    ]
+
+
+def _load_pure_python():
+    """The pure-Python module, even when the compiled extension shadows it"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "epistemic_distrust_v2.py")
+    spec = importlib.util.spec_from_file_location("epistemic_distrust_v2_pure", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class BatchParityTest(unittest.TestCase):
+    """compute_eds_batch must agree with compute_eds claim by claim"""
+
+    def test_batch_matches_single_claim(self):
+        eds = ImprovedDistrustScore()
+        claims = _claims() + [[]]
+        flags = [None, True, False, None]
+        batch = eds.compute_eds_batch(claims, claim_verified=flags, now=NOW)
+        for claim, flag, result in zip(claims, flags, batch):
+            single = eds.compute_eds(claim, claim_verified=flag, now=NOW)
+            self.assertEqual(result["verdict"], single["verdict"])
+            self.assertEqual(result.get("source_count"), single.get("source_count"))
+            self.assertEqual(result.get("unique_sources"), single.get("unique_sources"))
+            self.assertAlmostEqual(result["distrust_score"], single["distrust_score"], places=12)
+            self.assertEqual(result["components"].keys(), single["components"].keys())
+            for key, value in single["components"].items():
+                self.assertAlmostEqual(result["components"][key], value, places=12)
+
+    def test_evidence_batch_matches_list(self):
+        eds = ImprovedDistrustScore()
+        for claim in _claims():
+            from_list = eds.compute_eds(claim, now=NOW)
+            from_batch = eds.compute_eds(eds_v2.EvidenceBatch.from_sources(claim), now=NOW)
+            self.assertEqual(from_batch, from_list)
+
+
+class EmbeddingRowsTest(unittest.TestCase):
+    """Embedding rows must line up one-to-one with sources"""
+
+    def test_single_claim_row_mismatch(self):
+        with self.assertRaisesRegex(ValueError, "2 rows but there are 3 sources"):
+            ImprovedDistrustScore().compute_eds(_claims()[2], now=NOW, embeddings=np.eye(2, 4))
+
+    def test_batch_row_mismatch_names_the_claim(self):
+        embeddings = [None, np.eye(3, 4), np.eye(4)]
+        with self.assertRaisesRegex(ValueError, r"embeddings\[2\] has 4 rows but claim 2 has 3 sources"):
+            ImprovedDistrustScore().compute_eds_batch(_claims(), now=NOW, embeddings=embeddings)
+
+
+class EvidenceSourceTest(unittest.TestCase):
+    def test_intern_returns_the_live_instance(self):
+        first = EvidenceSource.intern("Breaking news", 0.8, NOW, "cnn")
+        self.assertIs(EvidenceSource.intern("Breaking news", 0.8, NOW, "cnn"), first)
+        self.assertIsNot(EvidenceSource.intern("Breaking news", 0.8, NOW, "nyt"), first)
+
+    def test_pickle_round_trip(self):
+        claim = _claims()[2] + [EvidenceSource("study 1 ", 0.2, NOW, "researcher_a")]
+        restored = pickle.loads(pickle.dumps(claim))
+        self.assertEqual(restored, claim)
+        self.assertEqual([hash(s) for s in restored], [hash(s) for s in claim])
+        self.assertEqual([s._epoch for s in restored], [s._epoch for s in claim])
+        self.assertEqual([s._content_key for s in restored], [s._content_key for s in claim])
+        self.assertEqual([s._source_key for s in restored], [s._source_key for s in claim])
+
+        eds = ImprovedDistrustScore()
+        self.assertEqual(eds.compute_eds(restored, now=NOW), eds.compute_eds(claim, now=NOW))
+
+
+class CoordinationKernelTest(unittest.TestCase):
+    """The numba pair-count kernel must agree with the BLAS path"""
+
+    def setUp(self):
+        self.kernel = eds_v2._load_kernel("coord_pair_count")
+        if self.kernel is None:
+            self.skipTest("numba not installed")
+
+        # Clusters of near-duplicates (cosine ~0.95) among random rows, so
+        # plenty of pairs sit well clear of the threshold on either side
+        rng = np.random.default_rng(0)
+        n, d = eds_v2._JIT_MIN_EMBEDDINGS + 16, eds_v2._JIT_MAX_EMBEDDING_DIM // 2
+        E = rng.standard_normal((n, d))
+        E[: n // 2] = E[0] + 0.2 * rng.standard_normal((n // 2, d))
+        self.E = (E / np.linalg.norm(E, axis=1)[:, None]).astype(np.float32)
+
+    def test_kernel_matches_numpy(self):
+        threshold = 0.85
+        n = self.E.shape[0]
+        upper_triangle = (self.E @ self.E.T)[np.triu_indices(n, k=1)]
+        expected = int((upper_triangle > threshold).sum())
+        self.assertGreater(expected, 0)
+        self.assertEqual(self.kernel(self.E, threshold), expected)
+        self.assertAlmostEqual(
+            eds_v2._coord_pair_fraction(self.E, threshold), expected / (n * (n - 1) / 2), places=12
+        )
+
+
+@unittest.skipUnless(COMPILED, "mypyc build not present (python mypyc_build.py build_ext --inplace)")
+class NativeBuildTest(unittest.TestCase):
+    """Smoke tests for the mypyc extension: it enforces annotations at runtime"""
+
+    def test_accepts_numpy_bool_flag(self):
+        eds = ImprovedDistrustScore()
+        result = eds.compute_eds(_claims()[2], claim_verified=np.bool_(True), now=NOW)
+        expected = eds.compute_eds(_claims()[2], claim_verified=True, now=NOW)
+        self.assertEqual(result["distrust_score"], expected["distrust_score"])
+
+    def test_batch_accepts_any_sequence(self):
+        eds = ImprovedDistrustScore()
+        claims = _claims()
+        flags = np.array([True, False, True])
+        embeddings = (None, None, np.eye(3, 8))
+        from_arrays = eds.compute_eds_batch(claims, claim_verified=flags, now=NOW, embeddings=embeddings)
+        from_lists = eds.compute_eds_batch(
+            claims, claim_verified=[True, False, True], now=NOW, embeddings=list(embeddings)
+        )
+        self.assertEqual(
+            [r["distrust_score"] for r in from_arrays], [r["distrust_score"] for r in from_lists]
+        )
+
+    def test_matches_pure_python(self):
+        pure = _load_pure_python()
+        native_scores = [
+            r["distrust_score"] for r in ImprovedDistrustScore().compute_eds_batch(_claims(), now=NOW)
+        ]
+        pure_claims = [
+            [pure.EvidenceSource(s.content, s.authority_weight, s.timestamp, s.source_id) for s in claim]
+            for claim in _claims()
+        ]
+        pure_scores = [
+            r["distrust_score"] for r in pure.ImprovedDistrustScore().compute_eds_batch(pure_claims, now=NOW)
+        ]
+        for native_score, pure_score in zip(native_scores, pure_scores):
+            self.assertAlmostEqual(native_score, pure_score, places=12)
+
+
+if __name__ == "__main__":
+    unittest.main()